@@ -5,6 +5,7 @@ import sys
 import traceback
 import zipfile
 from typing import Dict, Any
+import msgspec
 from my_proof.proof import Proof
 
 INPUT_DIR, OUTPUT_DIR, SEALED_DIR = '/input', '/output', '/sealed'
@@ -34,8 +35,8 @@ def run() -> None:
     proof_response = proof.generate()
 
     output_path = os.path.join(OUTPUT_DIR, "results.json")
-    with open(output_path, 'w') as f:
-        json.dump(proof_response.dict(), f, indent=2)
+    with open(output_path, 'wb') as f:
+        f.write(msgspec.json.format(msgspec.json.encode(proof_response), indent=2))
     logging.info(f"Proof generation complete: {proof_response}")
     
 if __name__ == "__main__":
@@ -1,9 +1,9 @@
 from typing import Dict, Optional, Any
 
-from pydantic import BaseModel
+import msgspec
 
 
-class ProofResponse(BaseModel):
+class ProofResponse(msgspec.Struct):
     """
     Represents the response of a proof of contribution. Only the score and metadata will be written onchain, the rest of the proof lives offchain.
 
@@ -32,5 +32,5 @@ class ProofResponse(BaseModel):
     ownership: float = 0.0
     authenticity: float = 0.0
     uniqueness: float = 0.0
-    attributes: Optional[Dict[str, Any]] = {}
-    metadata: Optional[Dict[str, Any]] = {}  # Human-readable metadata
+    attributes: Optional[Dict[str, Any]] = msgspec.field(default_factory=dict)
+    metadata: Optional[Dict[str, Any]] = msgspec.field(default_factory=dict)  # Human-readable metadata
@@ -1,22 +1,27 @@
+import copy
+import hashlib
 import json
 import logging
 import os
-from typing import Dict, Any
-from eth_account import Account
-from eth_abi import encode
-from eth_account.messages import encode_defunct
-import base64
-from my_proof.utils.decrypt import decryptData, verifyDataHash
+import threading
+import zipfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+from my_proof.utils.decrypt import verifyDataHash
+from my_proof.utils.signature import hash_personal_message, recover_address
 from my_proof.models.proof_response import ProofResponse
-from my_proof.utils.labeling import label_browsing_behavior
-from my_proof.validation.evaluations import (
-    evaluate_correctness,
-    evaluate_quality,
-    sigmoid,
-)
+from my_proof.utils.labeling import LOW_LABEL, label_browsing_behavior
+from my_proof.validation.evaluations import evaluate_session, sigmoid
 from my_proof.validation.metrics import recalculate_evaluation_metrics, verify_evaluation_metrics
 import my_proof.utils.constants as constants
 
+# Proof results memoized by the SHA-256 of the raw input plus the config they
+# depend on, so re-scoring the same contribution skips the whole pipeline.
+_RESULT_CACHE: "OrderedDict[Tuple[str, Optional[str], int], ProofResponse]" = OrderedDict()
+_RESULT_CACHE_MAX_SIZE = 256
+_RESULT_CACHE_LOCK = threading.Lock()
+
 
 class Proof:
     def __init__(self, config: Dict[str, Any]):
@@ -25,27 +30,61 @@ class Proof:
     def generate(self) -> ProofResponse:
         """Generate the proof response based on the input data."""
         logging.info("Starting proof generation")
+        raw_input = self.read_input_file(self.find_input_file())
+        cache_key = (
+            hashlib.sha256(raw_input).hexdigest(),
+            self.config.get('signed_message'),
+            self.config['dlp_id'],
+        )
+        with _RESULT_CACHE_LOCK:
+            cached_response = _RESULT_CACHE.get(cache_key)
+            if cached_response is not None:
+                _RESULT_CACHE.move_to_end(cache_key)
+        if cached_response is not None:
+            logging.info("Input already scored, reusing the cached proof")
+            return copy.deepcopy(cached_response)
+
         # Load and decrypt the input data
-        input_data = self.load_input_data()
+        # Parsed with the same stdlib json that re-serializes it for verifyDataHash,
+        # so big integers and out-of-range floats round-trip as the hash expects
+        input_data = json.loads(raw_input)
         # Create the proof response
         proof_response = self.create_proof_response(input_data)
 
+        with _RESULT_CACHE_LOCK:
+            _RESULT_CACHE[cache_key] = copy.deepcopy(proof_response)
+            if len(_RESULT_CACHE) > _RESULT_CACHE_MAX_SIZE:
+                _RESULT_CACHE.popitem(last=False)
         return proof_response
 
-    def load_input_data(self) -> Dict[str, Any]:
-        """Load the input data from a JSON file in the input directory."""
-        input_dir = self.config['input_dir']
-        json_files = [
-            f for f in os.listdir(input_dir) if f.lower().endswith('.zip')
-        ]
-        if not json_files:
+    def find_input_file(self) -> str:
+        """Return the path of the input file in the input directory."""
+        input_file = None
+        with os.scandir(self.config['input_dir']) as entries:
+            for entry in entries:
+                if not (entry.name.lower().endswith('.zip') and entry.is_file()):
+                    continue
+                if input_file is not None:
+                    logging.warning("Multiple JSON input files found. Using the first one.")
+                    break
+                input_file = entry.path
+        if input_file is None:
             raise FileNotFoundError("No JSON input files found in the input directory.")
-        if len(json_files) > 1:
-            logging.warning("Multiple JSON input files found. Using the first one.")
-        input_file = os.path.join(input_dir, json_files[0])
-        with open(input_file, 'r') as f:
-            input_data = json.load(f)
-        return input_data
+        return input_file
+
+    def read_input_file(self, input_file: str) -> bytes:
+        """Read the raw JSON bytes of an input file, extracting them first if it is a zip archive."""
+        if not zipfile.is_zipfile(input_file):
+            with open(input_file, 'rb') as f:
+                return f.read()
+        with zipfile.ZipFile(input_file) as archive:
+            names = [name for name in archive.namelist() if not name.endswith('/')]
+            json_names = [name for name in names if name.lower().endswith('.json')] or names
+            if not json_names:
+                raise FileNotFoundError(f"No JSON file found in input archive {input_file}.")
+            if len(json_names) > 1:
+                logging.warning("Multiple JSON files found in the input archive. Using the first one.")
+            return archive.read(json_names[0])
 
     def create_proof_response(
         self, input_data: Dict[str, Any]
@@ -63,8 +102,17 @@ class Proof:
         recalculated_metrics = recalculate_evaluation_metrics(input_data.get('data', {}))
         authenticity = verify_evaluation_metrics(recalculated_metrics, given_metrics)
         integrity = verifyDataHash(input_data.get('data', {}),input_data['data_hash'])
-       # Evaluate browsing data
-        evaluation_result = self.evaluate_browsing_data(input_data.get('data', {}))
+        # Evaluate browsing data, unless the proof can no longer be valid
+        if ownership and integrity:
+            evaluation_result = self.evaluate_browsing_data(input_data.get('data', {}))
+        else:
+            logging.info("Ownership or integrity check failed, skipping browsing data evaluation")
+            evaluation_result = {
+                'correctness': False,
+                'quality_score': 0.0,
+                'final_score': 0.0,
+                'label': LOW_LABEL,
+            }
         correctness = evaluation_result['correctness']        # Raw correctness score
         quality = evaluation_result['quality_score']  # Raw quality score
         final_score = evaluation_result['final_score']
@@ -106,17 +154,17 @@ class Proof:
             logging.error(f"Missing ownership verification data: {', '.join(missing_fields)}")
             return 0.0
 
-        # Step 1: Encode the Message as Defunct (Treat as Text)
+        # Step 1: Hash the Message as an EIP-191 Personal Message (Treat as Text)
         try:
             # Since the client signs the hex string, treat random_string as text
-            message_encoded = encode_defunct(text=random_string)
+            message_hash = hash_personal_message(random_string)
         except Exception as e:
             logging.error(f"Failed to encode message: {e}")
             return 0.0
 
         # Step 2: Recover the Signer's Address from the Signature
         try:
-            recovered_address = Account.recover_message(message_encoded, signature=signature)
+            recovered_address = recover_address(message_hash, signature)
             # Compare the recovered address with the provided author address (case-insensitive)
             is_valid = 1.0 if recovered_address.lower() == author.lower() else 0.0
             if is_valid:
@@ -127,13 +175,22 @@ class Proof:
         except Exception as e:
             logging.error(f"Ownership verification failed: {e}")
             return 0.0
+
+    def verify_ownership_batch(
+        self, items: Iterable[Tuple[str, str, str]], max_workers: Optional[int] = None
+    ) -> List[float]:
+        """Verify the ownership of several (author, signature, random_string) items in parallel."""
+        # coincurve releases the GIL while recovering, so threads scale here
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda item: self.verify_ownership(*item), items))
     
 
     def evaluate_browsing_data(self, browsing_data: Dict[str, Any]) -> Dict[str, Any]:
         """Evaluate the browsing data for correctness and quality."""
         data_array = browsing_data.get("browsingDataArray", [])
-        correctness = evaluate_correctness(data_array)
-        quality = evaluate_quality(data_array)
+        session = evaluate_session(data_array)
+        correctness = session['correctness']
+        quality = session['quality']
         sigmoid_score = sigmoid(quality)
         label = label_browsing_behavior(sigmoid_score)
 
@@ -3,7 +3,7 @@ MIN_TIME_SPENT_MS = 2000          # Minimum time spent on a page (2 seconds)
 MAX_TIME_SPENT_MS = 1800000       # Maximum time spent on a page (30 mins)
 
 # Completeness
-REQUIRED_FIELDS = {'url', 'timeSpent'}
+REQUIRED_FIELDS = frozenset({'url', 'timeSpent'})
 
 # Authenticity thresholds
 LONG_DURATION_THRESHOLD_MS = 300000  # 5 minutes (300,000 ms) without actions
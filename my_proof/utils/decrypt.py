@@ -1,6 +1,5 @@
 import base64
 import json
-from collections import OrderedDict
 import hashlib
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
@@ -31,10 +30,8 @@ def decryptData(encrypted_data, iv, signed_message):
 
 
 def serializeData(decrypted_data):
-    # Ensure the data is an OrderedDict to preserve key order
-    if not isinstance(decrypted_data, OrderedDict):
-        decrypted_data = json.loads(json.dumps(decrypted_data), object_pairs_hook=OrderedDict)
-    
+    # Dicts keep insertion order, so data loaded from JSON already serializes
+    # with its original key order; no need to round-trip it through OrderedDict.
     # Serialize to JSON string
     json_string = json.dumps(
         decrypted_data,
@@ -1,19 +1,44 @@
-import re
+def _scheme_length(url):
+    """
+    Returns the length of a leading http:// or https:// scheme (matched
+    case-insensitively), or 0 if the URL has neither.
+    """
+    head = url[:8].lower()
+    if head == 'https://':
+        return 8
+    if head.startswith('http://'):
+        return 7
+    return 0
+
 
 def extract_domain(url):
     """
     Extracts the domain from a given URL.
     """
-    pattern = r'^(?:https?)://([^/?#]+)'
-    match = re.match(pattern, url)
-    return match.group(1).lower() if match else None
+    if url.startswith('https://'):
+        start = 8
+    elif url.startswith('http://'):
+        start = 7
+    else:
+        return None
+    end = len(url)
+    for separator in '/?#':
+        index = url.find(separator, start, end)
+        if index >= 0:
+            end = index
+    return url[start:end].lower() if end > start else None
 
 
 def is_valid_url(url):
     """
-    Validates the URL format
+    Validates the URL format: an http(s) scheme followed by at least one
+    character and no whitespace (other than a single trailing newline).
     """
-    regex = re.compile(
-        r'^(?:https?)://'  # http://, https://
-        r'(?:\S+)$', re.IGNORECASE)
-    return re.match(regex, url) is not None
+    if not isinstance(url, str):
+        return False
+    # Like the original regex's `$`, accept a single trailing newline
+    if url.endswith('\n'):
+        url = url[:-1]
+    offset = _scheme_length(url)
+    # str.split() with no separator only returns [url] when url has no whitespace
+    return offset > 0 and len(url) > offset and url.split(None, 1) == [url]
@@ -1,12 +1,19 @@
 import my_proof.utils.constants as constants
 
+_HIGH_THRESHOLD = constants.HIGH_AUTHENTICITY_THRESHOLD
+_MODERATE_THRESHOLD = constants.MODERATE_AUTHENTICITY_THRESHOLD
+
+HIGH_LABEL = "High Authentic Browsing"
+MODERATE_LABEL = "Moderate quality, Some traits of human browsing"
+LOW_LABEL = "Low quality, Potentially Non-Human Browsing"
+
 def label_browsing_behavior(overall_score):
     """
     Labels the browsing behavior based on the overall score.
     """
-    if overall_score >= constants.HIGH_AUTHENTICITY_THRESHOLD:
-        return "High Authentic Browsing"
-    elif overall_score >= constants.MODERATE_AUTHENTICITY_THRESHOLD:
-        return "Moderate quality, Some traits of human browsing"
+    if overall_score >= _HIGH_THRESHOLD:
+        return HIGH_LABEL
+    elif overall_score >= _MODERATE_THRESHOLD:
+        return MODERATE_LABEL
     else:
-        return "Low quality, Potentially Non-Human Browsing"
+        return LOW_LABEL
@@ -0,0 +1,52 @@
+from coincurve import PublicKey
+from eth_utils import keccak, to_checksum_address
+
+# Prefix of EIP-191 "personal_sign" messages (version 0x45)
+PERSONAL_MESSAGE_PREFIX = b"\x19Ethereum Signed Message:\n"
+
+
+def hash_personal_message(text):
+    """
+    Hashes a text message the way personal_sign / encode_defunct(text=...) does.
+    """
+    message = text.encode('utf-8')
+    return keccak(PERSONAL_MESSAGE_PREFIX + str(len(message)).encode() + message)
+
+
+def to_recoverable_signature(signature):
+    """
+    Converts a 65-byte Ethereum signature (r || s || v, hex string or bytes)
+    into the r || s || recovery_id layout expected by coincurve.
+    Accepts v as 0/1, 27/28 or an EIP-155 chain-encoded value.
+    """
+    if isinstance(signature, str):
+        signature = bytes.fromhex(signature[2:] if signature.startswith(('0x', '0X')) else signature)
+    if len(signature) != 65:
+        raise ValueError(f"Unexpected signature length: {len(signature)} bytes")
+    v = signature[64]
+    if v in (0, 1):
+        recovery_id = v
+    elif v in (27, 28):
+        recovery_id = v - 27
+    elif v >= 35:
+        recovery_id = (v - 35) % 2
+    else:
+        raise ValueError(f"Invalid signature v value: {v}")
+    return signature[:64] + bytes((recovery_id,))
+
+
+def public_key_to_address(public_key):
+    """
+    Derives the checksummed Ethereum address of a coincurve public key.
+    """
+    return to_checksum_address(keccak(public_key.format(compressed=False)[1:])[-20:])
+
+
+def recover_address(message_hash, signature):
+    """
+    Recovers the address that produced `signature` over the 32-byte `message_hash`.
+    """
+    public_key = PublicKey.from_signature_and_message(
+        to_recoverable_signature(signature), message_hash, hasher=None
+    )
+    return public_key_to_address(public_key)
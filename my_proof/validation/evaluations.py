@@ -1,7 +1,10 @@
 import my_proof.utils.constants as constants
 from my_proof.utils.defs import is_valid_url
-import statistics
+import logging
 import math
+import numpy as np
+
+_exp = math.exp
 
 def sigmoid(x, k=constants.K, x0=constants.X0):
     """
@@ -11,8 +14,20 @@ def sigmoid(x, k=constants.K, x0=constants.X0):
         - k: Steepness of the curve.
         - x0: Midpoint of the sigmoid curve.
     """
-    z = k * (x - x0)
-    return 1 / (1 + math.exp(-z))
+    return 1.0 / (1.0 + _exp(-k * (x - x0)))
+
+def sigmoid_batch(xs, k=constants.K, x0=constants.X0):
+    """
+    Vectorized sigmoid over an array of normalized scores, see sigmoid().
+    """
+    return 1.0 / (1.0 + np.exp(-k * (np.asarray(xs, dtype=np.float64) - x0)))
+
+def is_complete_entry(entry):
+    """
+    Whether a browsing entry is complete: it has both 'url' and 'timeSpent',
+    with a valid URL.
+    """
+    return constants.REQUIRED_FIELDS.issubset(entry.keys()) and is_valid_url(entry['url'])
 
 def evaluate_correctness(browsing_data):
     """
@@ -20,29 +35,14 @@ def evaluate_correctness(browsing_data):
     Only checks whether the provided dataArray follows the expected schema
     (i.e., each entry has 'url' and 'timeSpent', both valid).
     """
-    correctness = False
-
     total_entries = len(browsing_data)
-    completeness_issues = 0
-
-    for entry in browsing_data:
-        # Must contain both 'url' and 'timeSpent' keys
-        if not constants.REQUIRED_FIELDS.issubset(entry.keys()):
-            completeness_issues += 1
-            continue
-        # Validate URL
-        url = entry['url']
-        if not is_valid_url(url):
-            completeness_issues += 1
-            continue
-
     if total_entries == 0:
         return False  # No data => not correct
 
     # Example threshold:
     # "correct" if at least half of the entries are complete & valid
-    correctness = (total_entries - completeness_issues) >= (total_entries / 2)
-    return correctness
+    valid_entries = sum(1 for entry in browsing_data if is_complete_entry(entry))
+    return valid_entries >= (total_entries / 2)
 
 def parse_domain_and_path(url):
     """
@@ -52,85 +52,104 @@ def parse_domain_and_path(url):
         -> domain = "en.wikipedia.org"
         -> path   = "/wiki/University_of_California"
     """
-    stripped = url.replace("https://", "").replace("http://", "")
-    parts = stripped.split("/", 1)  # split into at most 2 parts
-    domain = parts[0]
-    path = "/" + parts[1] if len(parts) > 1 else "/"
-    return domain, path
+    offset = 0
+    if url.startswith(("https://", "http://")):
+        offset = 8 if url[4] == "s" else 7
+    domain, separator, path = url[offset:].partition("/")
+    return domain, "/" + path if separator else "/"
 
 def get_base_path(path):
     """
     A simplified approach to get the 'base path':
       e.g. "/wiki/University_of_California" -> "/wiki"
     """
-    tokens = path.strip("/").split("/")
-    if len(tokens) == 0 or not tokens[0]:
+    first_segment = path.lstrip("/").partition("/")[0]
+    if not first_segment:
         return "/"  # no sub-path
-    return f"/{tokens[0]}"
+    return "/" + first_segment
+
+def time_spent_array(time_spent_values):
+    """
+    Converts a list of timeSpent values (in ms) into a float64 array.
+    Raises TypeError on non-numeric values (e.g. null or strings) instead of
+    letting them be coerced, so they can't slip past the time checks as NaN.
+    """
+    for value in time_spent_values:
+        if not isinstance(value, (int, float)):
+            raise TypeError(f"Invalid timeSpent value: {value!r}")
+    times = np.fromiter(time_spent_values, dtype=np.float64, count=len(time_spent_values))
+    if not np.isfinite(times).all():
+        raise ValueError("Invalid timeSpent value: not a finite number")
+    return times
+
+def count_consecutive_low(low_mask, block_size=3):
+    """
+    Counts the runs of consecutive True values in `low_mask` that are at
+    least `block_size` long.
+    """
+    padded = np.concatenate(([False], low_mask, [False])).astype(np.int8)
+    edges = np.diff(padded)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    return int(((ends - starts) >= block_size).sum())
+
+def time_spent_stats(times, block_size=3):
+    """
+    Computes the per-session timeSpent statistics used by evaluate_quality:
+    (short_visits, long_visits, similar_count, consecutive_low_blocks, mean_time).
+    """
+    low_mask = times < constants.MIN_TIME_SPENT_MS
+    short_visits = int(low_mask.sum())
+    long_visits = int((times > constants.LONG_DURATION_THRESHOLD_MS).sum())
+    similar_count = int((np.abs(np.diff(times)) < 300).sum())  # 0.3s
+    low_blocks = count_consecutive_low(low_mask, block_size=block_size)
+    mean_time = float(times.mean())
+    return short_visits, long_visits, similar_count, low_blocks, mean_time
 
 def evaluate_quality(browsing_data):
     """
-    Evaluates the session using three "quotas":
+    Evaluates the session quality, see evaluate_session().
+    Returns a final score in [0..1].
+    """
+    return evaluate_session(browsing_data)['quality']
+
+def evaluate_session(browsing_data):
+    """
+    Evaluates correctness and quality of the session in a single pass over
+    the entries.
+
+    Correctness follows evaluate_correctness(). Quality uses three "quotas":
       1) Navigation Path (weight=20)
       2) Time Duration (weight=50)
       3) Bot-Like Behavior (weight=30)
-    
-    Returns a final score in [0..1].
+
+    Returns a dict with 'correctness' (bool) and 'quality' (score in [0..1]).
     """
 
     total_entries = len(browsing_data)
     if total_entries == 0:
-        return 0.0
+        return {'correctness': False, 'quality': 0.0}
 
     # -----------------------------
     # A. Extract Basic Session Data
     # -----------------------------
-    short_visits = 0
-    long_visits = 0
     time_spent_values = []
-
-    # For domain continuity checks
-    no_continuity_count = 0
-    sub_path_continuity_count = 0
-
-    previous_domain = None
-    previous_base_path = None
-
-    # We'll also track all domain+path for advanced checks
-    session_domain_paths = []
+    completeness_issues = 0
 
     # Collect data
     for entry in browsing_data:
-        time_spent = entry.get('timeSpent', 0)
-        url = entry.get('url', '')
-
-        # short/long visits
-        if time_spent < constants.MIN_TIME_SPENT_MS:
-            short_visits += 1
-        if time_spent > constants.LONG_DURATION_THRESHOLD_MS:
-            long_visits += 1
-
-        time_spent_values.append(time_spent)
-
-        # Domain+path continuity
-        if url and is_valid_url(url):
-            domain, path = parse_domain_and_path(url)
-            base_path = get_base_path(path)
-            session_domain_paths.append((domain, base_path))
-
-            if previous_domain and domain != previous_domain:
-                no_continuity_count += 1
-            else:
-                # same domain => check sub-path continuity
-                if (previous_base_path and base_path == previous_base_path
-                        and domain == previous_domain):
-                    sub_path_continuity_count += 1
-
-            previous_domain = domain
-            previous_base_path = base_path
-        else:
-            # invalid or missing => just store a placeholder
-            session_domain_paths.append((None, None))
+        time_spent_values.append(entry.get('timeSpent', 0))
+        if not is_complete_entry(entry):
+            completeness_issues += 1
+
+    # "correct" if at least half of the entries are complete & valid
+    correctness = (total_entries - completeness_issues) >= (total_entries / 2)
+
+    # timeSpent values as a single contiguous array, reduced once into all the
+    # statistics needed by the time and bot-like checks below.
+    times = time_spent_array(time_spent_values)
+    (short_visits, long_visits, similar_count,
+     consecutive_low_blocks, mean_time) = time_spent_stats(times, block_size=3)
 
     # --------------
     # B. NAVIGATION (will be omitted for this version, not enough data point)
@@ -158,8 +177,6 @@ def evaluate_quality(browsing_data):
     time_duration_quota_score -= (0.3 * long_visit_ratio)
 
     # (C3) Extreme average
-    import statistics
-    mean_time = statistics.mean(time_spent_values)
     if mean_time < constants.MIN_TIME_SPENT_MS:
         time_duration_quota_score -= 0.3  # some penalty
     elif mean_time > constants.LONG_DURATION_THRESHOLD_MS:
@@ -177,10 +194,6 @@ def evaluate_quality(browsing_data):
     # (D1) Very similar timeSpent => suspicious
     # Let's define "very similar" = difference < 300ms
     # We'll check consecutive visits (or all pairs) for repeated or near-repeated times.
-    similar_count = 0
-    for i in range(total_entries - 1):
-        if abs(time_spent_values[i] - time_spent_values[i+1]) < 300:  # 0.3s
-            similar_count += 1
     if total_entries > 1:
         similar_ratio = similar_count / (total_entries - 1)
         # The higher the ratio, the bigger the penalty
@@ -188,24 +201,7 @@ def evaluate_quality(browsing_data):
 
     # (D2) Sliding window check for repeated low timeSpent
     # If we find multiple consecutive low visits (e.g. 3 in a row),
-    # that's suspicious. Let's define a small function to find consecutive blocks.
-    def count_consecutive_low(arr, threshold=constants.MIN_TIME_SPENT_MS, block_size=3):
-        consecutive_block_count = 0
-        current_count = 0
-        for val in arr:
-            if val < threshold:
-                current_count += 1
-            else:
-                # end block
-                if current_count >= block_size:
-                    consecutive_block_count += 1
-                current_count = 0
-        # check if ended with a block
-        if current_count >= block_size:
-            consecutive_block_count += 1
-        return consecutive_block_count
-
-    consecutive_low_blocks = count_consecutive_low(time_spent_values, block_size=3)
+    # that's suspicious.
     # for each found block, penalize
     if consecutive_low_blocks > 0:
         # e.g. subtract up to 0.5 for each block, but not below 0
@@ -225,11 +221,10 @@ def evaluate_quality(browsing_data):
 
     time_component = time_duration_quota_score * TIME_WEIGHT
     bot_component = bot_like_quota_score * BOT_WEIGHT
-    
-    print("time_component: ",time_component, "bot_component: ",bot_component)
+    logging.debug("time_component: %s bot_component: %s", time_component, bot_component)
 
     final_raw = time_component + bot_component  # should be in [0..100] theoretically
     final_clamped = max(min(final_raw, 100), 0)
     final_score = final_clamped / 100.0
 
-    return final_score
+    return {'correctness': correctness, 'quality': final_score}
@@ -1,7 +1,9 @@
 import math
 from typing import Dict
 
-import math
+import numpy as np
+
+from my_proof.validation.evaluations import time_spent_array
 
 EARLY_BONUS_MULTIPLIER = 3
 
@@ -9,17 +11,13 @@ def recalculate_evaluation_metrics(decrypted_data: dict) -> dict:
     encrypted_browsing_data_array = decrypted_data.get('browsingDataArray', [])
     
     url_count = len(encrypted_browsing_data_array)
-    time_spent_list = []
-    total_time_spent = 0  # In seconds
-    
-    for entry in encrypted_browsing_data_array:
-        # Handle time spent
-        time_spent_ms = entry.get('timeSpent', 0)
-        time_spent_sec = time_spent_ms / 1000.0  # Convert milliseconds to seconds
-        time_spent_sec_int = math.floor(time_spent_sec)  # Floor for consistency
-        time_spent_list.append(time_spent_sec_int)
-        total_time_spent += time_spent_sec_int
-        
+    # Time spent per entry, converted from milliseconds to whole seconds (floored for consistency); non-numeric values raise.
+    time_spent_ms = time_spent_array(
+        [entry.get('timeSpent', 0) for entry in encrypted_browsing_data_array]
+    )
+    time_spent_sec = np.floor(time_spent_ms / 1000.0).astype(np.int64)
+    time_spent_list = time_spent_sec.tolist()
+    total_time_spent = int(time_spent_sec.sum())  # In seconds
         
     # Calculate points: (URL count + total actions) * 10 + total time spent + total cookies
     points = math.floor((url_count + total_time_spent/60) * EARLY_BONUS_MULTIPLIER)
@@ -32,14 +30,13 @@ def recalculate_evaluation_metrics(decrypted_data: dict) -> dict:
     return calculated_metrics
 
 def verify_evaluation_metrics(calculated_metrics: dict, given_metrics: dict) -> bool:
-    calculated_points = calculated_metrics.get('points', 0)
-    given_points = given_metrics.get('points', 0)
-    points_match = (calculated_points == given_points)
-    
+    # Compare the scalar metrics first; the timeSpent lists are only compared
+    # when those already match (and list equality bails out on a length mismatch).
     metrics_match = (
+        calculated_metrics.get('points', 0) == given_metrics.get('points', 0) and
         calculated_metrics.get('url_count', 0) == given_metrics.get('url_count', 0) and
-        calculated_metrics.get('timeSpent', []) == given_metrics.get('timeSpent', []) 
+        calculated_metrics.get('timeSpent', []) == given_metrics.get('timeSpent', [])
     )
     
-    authenticity = 1.0 if points_match and metrics_match else 0.0
+    authenticity = 1.0 if metrics_match else 0.0
     return authenticity
@@ -0,0 +1,8 @@
+def make_entries(time_spent_values):
+    """
+    Builds a browsingDataArray with one valid URL per timeSpent value.
+    """
+    return [
+        {'url': f'https://example.com/page/{i}', 'timeSpent': value}
+        for i, value in enumerate(time_spent_values)
+    ]
@@ -0,0 +1,24 @@
+import unittest
+
+from my_proof.utils.defs import is_valid_url
+
+
+class IsValidUrlTest(unittest.TestCase):
+    def test_valid_urls(self):
+        self.assertTrue(is_valid_url('https://en.wikipedia.org/wiki/Python'))
+        self.assertTrue(is_valid_url('HTTP://example.com'))
+
+    def test_invalid_urls(self):
+        self.assertFalse(is_valid_url('ftp://example.com'))
+        self.assertFalse(is_valid_url('https://'))
+        self.assertFalse(is_valid_url('https://example.com/a b'))
+        self.assertFalse(is_valid_url(None))
+
+    def test_single_trailing_newline_is_accepted(self):
+        self.assertTrue(is_valid_url('https://a.com/x\n'))
+        self.assertFalse(is_valid_url('https://a.com/x\n\n'))
+        self.assertFalse(is_valid_url('https://\n'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import math
+import unittest
+
+from my_proof.validation.evaluations import evaluate_correctness, evaluate_session, time_spent_array
+from tests.factories import make_entries
+
+
+class EvaluateSessionTest(unittest.TestCase):
+    # Expected quality scores were computed with the original pure-Python
+    # evaluate_quality, so the NumPy reductions must reproduce them.
+    def assert_session(self, data, correctness, quality):
+        session = evaluate_session(data)
+        self.assertIs(session['correctness'], correctness)
+        self.assertAlmostEqual(session['quality'], quality, places=12)
+
+    def test_runs_of_short_visits(self):
+        # One run of 3 short visits, and a run of 4 at the end of the list
+        data = make_entries([1000, 500, 1500, 30000, 45000, 800, 900, 1200, 1000])
+        self.assert_session(data, True, 0.22999999999999995)
+
+    def test_similar_neighbour_times(self):
+        data = make_entries([10000, 10100, 10250, 40000, 40200, 60000])
+        self.assert_session(data, True, 0.88)
+
+    def test_long_visits_and_long_mean(self):
+        data = make_entries([400000, 350000, 20000, 500000])
+        self.assert_session(data, True, 0.685)
+
+    def test_short_mean(self):
+        data = make_entries([1000, 1500, 30000, 900])
+        self.assert_session(data, True, 0.775)
+
+    def test_float_times(self):
+        data = make_entries([2500.5, 2700.25, 64000.75, 1999.5])
+        self.assert_session(data, True, 0.8583333333333334)
+
+    def test_odd_length_correctness_threshold(self):
+        # 3 of 5 entries complete => correct
+        data = make_entries([12000, 45000, 30000, 8000, 61000])
+        for entry in data[3:]:
+            entry['url'] = 'not a url'
+        self.assert_session(data, True, 1.0)
+        self.assertTrue(evaluate_correctness(data))
+
+        # 2 of 5 entries complete => not correct
+        data = make_entries([12000, 45000, 30000, 8000, 61000])
+        for entry in data[2:]:
+            del entry['url']
+        self.assert_session(data, False, 1.0)
+        self.assertFalse(evaluate_correctness(data))
+
+    def test_empty_session(self):
+        self.assert_session([], False, 0.0)
+
+    def test_non_string_urls_are_incomplete(self):
+        data = make_entries([12000, 45000, 30000])
+        data[0]['url'] = ['https://example.com']
+        data[1]['url'] = {'href': 'https://example.com'}
+        self.assertFalse(evaluate_correctness(data))
+        self.assertFalse(evaluate_session(data)['correctness'])
+
+    def test_null_time_spent_is_rejected(self):
+        with self.assertRaises(TypeError):
+            evaluate_session(make_entries([None] * 6))
+
+
+class TimeSpentArrayTest(unittest.TestCase):
+    def test_numbers(self):
+        self.assertEqual(time_spent_array([12000, 2500.5, 0]).tolist(), [12000.0, 2500.5, 0.0])
+
+    def test_non_numeric_values_are_rejected(self):
+        for value in (None, '5000', [5000]):
+            with self.subTest(value=value), self.assertRaises(TypeError):
+                time_spent_array([12000, value])
+
+    def test_non_finite_values_are_rejected(self):
+        for value in (math.nan, math.inf):
+            with self.subTest(value=value), self.assertRaises(ValueError):
+                time_spent_array([12000, value])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,33 @@
+import unittest
+
+from my_proof.validation.metrics import recalculate_evaluation_metrics, verify_evaluation_metrics
+from tests.factories import make_entries
+
+
+class RecalculateEvaluationMetricsTest(unittest.TestCase):
+    def test_time_spent_is_floored_to_seconds(self):
+        metrics = recalculate_evaluation_metrics({'browsingDataArray': make_entries([12999, 45000, 800])})
+        self.assertEqual(metrics, {'url_count': 3, 'timeSpent': [12, 45, 0], 'points': 11})
+
+    def test_missing_time_spent_counts_as_zero(self):
+        data = make_entries([61000, 0])
+        del data[1]['timeSpent']
+        metrics = recalculate_evaluation_metrics({'browsingDataArray': data})
+        self.assertEqual(metrics, {'url_count': 2, 'timeSpent': [61, 0], 'points': 9})
+
+    def test_non_numeric_time_spent_is_rejected(self):
+        # Forged metrics must not be able to match coerced values
+        with self.assertRaises(TypeError):
+            recalculate_evaluation_metrics({'browsingDataArray': make_entries([12000, None])})
+
+
+class VerifyEvaluationMetricsTest(unittest.TestCase):
+    def test_matching_and_mismatching_metrics(self):
+        calculated = {'url_count': 3, 'timeSpent': [12, 45, 0], 'points': 11}
+        self.assertEqual(verify_evaluation_metrics(calculated, dict(calculated)), 1.0)
+        self.assertEqual(verify_evaluation_metrics(calculated, {**calculated, 'points': 12}), 0.0)
+        self.assertEqual(verify_evaluation_metrics(calculated, {**calculated, 'timeSpent': [12, 45, 1]}), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+
+from my_proof.proof import Proof
+from my_proof.utils.signature import hash_personal_message, recover_address
+
+# personal_sign signatures produced by eth_account for the private key 0x11..11
+AUTHOR = '0x19E7E376E7C213B7E7e7e46cc70A5dD086DAff2A'
+MESSAGE = '0x5f1d3c9a7e2b4d6f'
+SIGNATURE = (
+    'e48d4e67ebc7b146c776e60f25ee30c32a6e0fbd48474ef6ec186f63ee68e81c'
+    '3e12671e358b08bc203d7125ec67a7266f236a58db91babe5e8f6293e480ad9f1b'
+)  # v=27
+NON_ASCII_MESSAGE = 'héllo'
+NON_ASCII_SIGNATURE = (
+    '8315460f1ca6ef1ef3c413a25fc3ec1430314995691cbe6c6ba5e3156d58d419'
+    '7edd283ef0b981cb635cc48808087d2120a535095d9c2eada4e2397570c828c01b'
+)  # v=27
+V28_MESSAGE = 'random-3'
+V28_SIGNATURE = (
+    'b96f396db70097129d4f0290951c0721b1d01a46db46a3322978848ccad3e28f'
+    '5a34cab2656880086065333750cc3fdba157d878807fc35aab4dfbed07fab5c71c'
+)  # v=28
+OTHER_AUTHOR = '0x' + '22' * 20
+
+
+def with_v(signature, v):
+    return signature[:-2] + format(v, '02x')
+
+
+class RecoverAddressTest(unittest.TestCase):
+    def test_hex_signature_with_and_without_prefix(self):
+        message_hash = hash_personal_message(MESSAGE)
+        self.assertEqual(recover_address(message_hash, SIGNATURE), AUTHOR)
+        self.assertEqual(recover_address(message_hash, '0x' + SIGNATURE), AUTHOR)
+        self.assertEqual(recover_address(message_hash, bytes.fromhex(SIGNATURE)), AUTHOR)
+
+    def test_non_ascii_message(self):
+        message_hash = hash_personal_message(NON_ASCII_MESSAGE)
+        self.assertEqual(recover_address(message_hash, NON_ASCII_SIGNATURE), AUTHOR)
+
+    def test_v_27_28_and_0_1(self):
+        for message, signature, v in ((MESSAGE, SIGNATURE, 0), (V28_MESSAGE, V28_SIGNATURE, 1)):
+            message_hash = hash_personal_message(message)
+            with self.subTest(message=message):
+                self.assertEqual(recover_address(message_hash, signature), AUTHOR)
+                self.assertEqual(recover_address(message_hash, with_v(signature, v)), AUTHOR)
+
+    def test_invalid_v_is_rejected(self):
+        with self.assertRaises(ValueError):
+            recover_address(hash_personal_message(MESSAGE), with_v(SIGNATURE, 5))
+
+    def test_invalid_length_is_rejected(self):
+        with self.assertRaises(ValueError):
+            recover_address(hash_personal_message(MESSAGE), SIGNATURE[:-2])
+
+
+class VerifyOwnershipTest(unittest.TestCase):
+    def setUp(self):
+        self.proof = Proof({'dlp_id': 10})
+
+    def test_matching_author(self):
+        self.assertEqual(self.proof.verify_ownership(AUTHOR, SIGNATURE, MESSAGE), 1.0)
+        self.assertEqual(self.proof.verify_ownership(AUTHOR.lower(), '0x' + SIGNATURE, MESSAGE), 1.0)
+
+    def test_mismatched_author(self):
+        with self.assertLogs(level='WARNING'):
+            self.assertEqual(self.proof.verify_ownership(OTHER_AUTHOR, SIGNATURE, MESSAGE), 0.0)
+
+    def test_wrong_message(self):
+        with self.assertLogs(level='WARNING'):
+            self.assertEqual(self.proof.verify_ownership(AUTHOR, SIGNATURE, V28_MESSAGE), 0.0)
+
+    def test_invalid_signature(self):
+        with self.assertLogs(level='ERROR'):
+            self.assertEqual(self.proof.verify_ownership(AUTHOR, with_v(SIGNATURE, 5), MESSAGE), 0.0)
+
+    def test_missing_fields(self):
+        with self.assertLogs(level='ERROR'):
+            self.assertEqual(self.proof.verify_ownership(AUTHOR, None, MESSAGE), 0.0)
+
+    def test_batch_keeps_item_order(self):
+        items = [
+            (AUTHOR, SIGNATURE, MESSAGE),
+            (OTHER_AUTHOR, SIGNATURE, MESSAGE),
+            (AUTHOR, V28_SIGNATURE, V28_MESSAGE),
+            (AUTHOR, with_v(SIGNATURE, 5), MESSAGE),
+        ]
+        with self.assertLogs(level='WARNING'):
+            results = self.proof.verify_ownership_batch(items, max_workers=2)
+        self.assertEqual(results, [1.0, 0.0, 1.0, 0.0])
+
+
+if __name__ == '__main__':
+    unittest.main()